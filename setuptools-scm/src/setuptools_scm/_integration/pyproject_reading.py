@@ -10,7 +10,6 @@ from vcs_versioning._pyproject_reading import GivenPyProjectResult
 from vcs_versioning._pyproject_reading import PyProjectData
 from vcs_versioning._pyproject_reading import get_args_for_pyproject
 from vcs_versioning._pyproject_reading import read_pyproject as _vcs_read_pyproject
-from vcs_versioning._requirement_cls import Requirement
 from vcs_versioning._requirement_cls import extract_package_name
 from vcs_versioning._toml import TOML_RESULT
 
@@ -68,6 +67,9 @@ def has_build_package_with_extra(
     Returns:
         True if the package is found with the specified extra
     """
+    # the full PEP 508 parser is only needed to see the extras
+    from vcs_versioning._requirement_cls import Requirement
+
     for requirement_string in requires:
         try:
             requirement = Requirement(requirement_string)
@@ -603,6 +603,19 @@ def test_extract_package_name(base_name: str, requirements: str) -> None:
     assert extract_package_name(f"{base_name}{requirements}") == "setuptools-scm"
 
 
+@pytest.mark.parametrize(
+    "requirement",
+    ["setuptools-\u212a", "\u017fetuptools"],
+    ids=["kelvin-sign", "long-s"],
+)
+def test_extract_package_name_rejects_non_ascii_names(requirement: str) -> None:
+    """Unicode case folding must not let non-ASCII names pass as bare names"""
+    from packaging.requirements import InvalidRequirement
+
+    with pytest.raises(InvalidRequirement):
+        extract_package_name(requirement)
+
+
 # Helper function for creating and managing distribution objects
 def create_clean_distribution(name: str) -> setuptools.Distribution:
     """Create a clean distribution object without any setuptools_scm effects.
@@ -175,6 +175,32 @@ def test_read_pyproject_with_given_definition(monkeypatch: pytest.MonkeyPatch) -
     assert should_infer(res)
 
 
+@pytest.mark.parametrize(
+    ("requires", "expected"),
+    [
+        (["setuptools", "wheel"], False),
+        (["Setuptools.SCM>=8"], True),
+        (["setuptools__scm"], True),
+        (["setuptools-scm-git-archive"], False),
+    ],
+)
+def test_read_pyproject_is_required(requires: list[str], expected: bool) -> None:
+    res = read_pyproject(_given_definition={"build-system": {"requires": requires}})
+    assert res.is_required is expected
+
+
+def test_read_pyproject_invalid_requirement_raises() -> None:
+    """Malformed build requirements are reported, not silently skipped."""
+    from packaging.requirements import InvalidRequirement
+
+    with pytest.raises(InvalidRequirement):
+        read_pyproject(
+            _given_definition={
+                "build-system": {"requires": ["setuptools>=", "setuptools-scm"]}
+            }
+        )
+
+
 def test_read_pyproject_with_setuptools_dynamic_version_warns() -> None:
     """Test that warning is issued when version inference is enabled."""
     with pytest.warns(
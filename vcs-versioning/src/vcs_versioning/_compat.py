@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 import sys
 from importlib.metadata import entry_points as _stdlib_entry_points
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Union
 
 if sys.version_info >= (3, 10):
     from typing import TypeAlias
@@ -19,6 +19,9 @@ if TYPE_CHECKING:
 else:
     PathT: TypeAlias = Union[os.PathLike, str]
 
+# keyword arguments for @dataclass to drop the instance __dict__ where supported
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 if sys.version_info >= (3, 10):
     from importlib.metadata import entry_points as entry_points
@@ -16,9 +16,13 @@ import dataclasses
 import logging
 import os
 from collections.abc import Mapping, MutableMapping
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal
 
+from ._compat import DATACLASS_SLOTS
+from ._log import _configure_loggers
+
 if TYPE_CHECKING:
     from pytest import MonkeyPatch
 
@@ -38,16 +42,15 @@ def resolve_runtime_env() -> VcsEnvironment:
     ``GlobalOverrides.from_active()`` are merged on top when they differ
     from the freshly-read values.
     """
-    import dataclasses as dc
-
     from .overrides import get_active_vcs_env
 
     active = get_active_vcs_env()
-    user_tools: tuple[str, ...] = ()
-    if active is not None:
-        user_tools = tuple(n for n in active.tool_names if n != "VCS_VERSIONING")
-    fresh = VcsEnvironment.from_env(*user_tools, env=active._env if active else None)
     if active is None:
+        return VcsEnvironment.from_env()
+
+    user_tools = tuple(n for n in active.tool_names if n != "VCS_VERSIONING")
+    fresh = VcsEnvironment.from_env(*user_tools, env=active._env)
+    if not active._explicit_overrides:
         return fresh
 
     changes = {
@@ -56,30 +59,66 @@ def resolve_runtime_env() -> VcsEnvironment:
         if getattr(active, field) != getattr(fresh, field)
     }
     if changes:
-        return dc.replace(fresh, **changes)
+        return dataclasses.replace(fresh, **changes)
     return fresh
 
 
 _DEFAULT_HG_COMMAND = "hg"
 
 
+# level names accepted for DEBUG, same as logging's own name mapping
+_LEVEL_NAMES = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+
+@lru_cache(maxsize=32)
+def _parse_int(value: str) -> int | None:
+    """Parse an integer env-var value, None if it is not a valid integer."""
+    if value.isdecimal():
+        return int(value)
+    if not value.strip().lstrip("+-")[:1].isdecimal():
+        # can't be an integer, don't go through int()'s ValueError
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=32)
 def _parse_debug(value: str | None) -> int | Literal[False]:
     """Parse a DEBUG env-var value into a log level or False."""
     if value is None:
         return False
-    try:
-        parsed_int = int(value)
-        if parsed_int in (0, 1):
-            return logging.DEBUG if parsed_int else False
-        return parsed_int
-    except ValueError:
-        level_value = getattr(logging, value.upper(), None)
-        if isinstance(level_value, int):
-            return level_value
-        return logging.DEBUG
+    parsed_int = _parse_int(value)
+    if parsed_int is None:
+        return _LEVEL_NAMES.get(value.upper(), logging.DEBUG)
+    if parsed_int in (0, 1):
+        return logging.DEBUG if parsed_int else False
+    return parsed_int
+
+
+@lru_cache(maxsize=8)
+def _export_names(prefix: str) -> tuple[str, str, str, str, str]:
+    """Env var names ``export`` writes for a tool prefix."""
+    return (
+        f"{prefix}_DEBUG",
+        f"{prefix}_SUBPROCESS_TIMEOUT",
+        f"{prefix}_HG_COMMAND",
+        f"{prefix}_DISABLE_JJ",
+        f"{prefix}_IGNORE_VCS_ROOTS",
+    )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class VcsEnvironment:
     """Runtime environment captured from env vars at creation time.
 
@@ -102,17 +141,19 @@ class VcsEnvironment:
     _explicit_overrides: frozenset[str] = dataclasses.field(
         default=frozenset(), repr=False, compare=False
     )
+    _log_level: int = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # debug can't change on a frozen instance, resolve the level once
+        log_level = logging.WARNING if self.debug is False else self.debug
+        object.__setattr__(self, "_log_level", log_level)
 
     def log_level(self) -> int:
         """Logging level derived from the debug setting."""
-        if self.debug is False:
-            return logging.WARNING
-        return self.debug
+        return self._log_level
 
     def configure_logging(self) -> None:
         """Configure all loggers for this environment's debug level."""
-        from ._log import _configure_loggers
-
         _configure_loggers(
             log_level=self.log_level(),
             additional_loggers=list(self.additional_loggers),
@@ -128,8 +169,6 @@ class VcsEnvironment:
 
     def source_epoch_or_utc_now(self) -> datetime:
         """Get datetime from SOURCE_DATE_EPOCH or current UTC time."""
-        from datetime import timezone
-
         if self.source_date_epoch is not None:
             return datetime.fromtimestamp(self.source_date_epoch, timezone.utc)
         return datetime.now(timezone.utc)
@@ -137,33 +176,29 @@ class VcsEnvironment:
     def export(self, target: MutableMapping[str, str] | MonkeyPatch) -> None:
         """Export settings to environment variables using ``tool_names[0]`` as prefix."""
 
-        def set_var(key: str, value: str) -> None:
-            if isinstance(target, MutableMapping):
-                target[key] = value
-            else:
-                target.setenv(key, value)
-
+        variables: dict[str, str] = {}
         if self.source_date_epoch is not None:
-            set_var("SOURCE_DATE_EPOCH", str(self.source_date_epoch))
-
-        prefix = self.tool_names[0]
+            variables["SOURCE_DATE_EPOCH"] = str(self.source_date_epoch)
 
-        if self.debug is False:
-            set_var(f"{prefix}_DEBUG", "0")
-        else:
-            set_var(f"{prefix}_DEBUG", str(self.debug))
+        debug_name, timeout_name, hg_name, jj_name, roots_name = _export_names(
+            self.tool_names[0]
+        )
 
-        set_var(f"{prefix}_SUBPROCESS_TIMEOUT", str(self.subprocess_timeout))
-        set_var(f"{prefix}_HG_COMMAND", self.hg_command)
+        variables[debug_name] = "0" if self.debug is False else str(self.debug)
+        variables[timeout_name] = str(self.subprocess_timeout)
+        variables[hg_name] = self.hg_command
 
         if self.disable_jj:
-            set_var(f"{prefix}_DISABLE_JJ", "1")
+            variables[jj_name] = "1"
 
         if self.ignore_vcs_roots:
-            set_var(
-                f"{prefix}_IGNORE_VCS_ROOTS",
-                os.pathsep.join(self.ignore_vcs_roots),
-            )
+            variables[roots_name] = os.pathsep.join(self.ignore_vcs_roots)
+
+        if isinstance(target, MutableMapping):
+            target.update(variables)
+        else:
+            for key, value in variables.items():
+                target.setenv(key, value)
 
     @classmethod
     def from_env(
@@ -184,19 +219,31 @@ class VcsEnvironment:
 
         from .overrides import EnvReader
 
-        reader = EnvReader(tools_names=all_names, env=env, dist_name=dist_name)
+        settings_env = env
+        if dist_name is not None:
+            # every miss for a dist name scans the environment for misspelled
+            # variables, collect everything the reads can touch in one pass
+            prefixes = tuple(f"{name}_" for name in all_names)
+            settings_env = {
+                key: value
+                for key, value in env.items()
+                if key.startswith(prefixes) or key == "SOURCE_DATE_EPOCH"
+            }
+
+        reader = EnvReader(tools_names=all_names, env=settings_env, dist_name=dist_name)
 
         timeout_val = reader.read("SUBPROCESS_TIMEOUT")
         subprocess_timeout = _DEFAULT_SUBPROCESS_TIMEOUT
         if timeout_val is not None:
-            try:
-                subprocess_timeout = int(timeout_val)
-            except ValueError:
+            parsed_timeout = _parse_int(timeout_val)
+            if parsed_timeout is None:
                 log.warning(
                     "Invalid SUBPROCESS_TIMEOUT value '%s', using default %d",
                     timeout_val,
                     subprocess_timeout,
                 )
+            else:
+                subprocess_timeout = parsed_timeout
 
         hg_command = reader.read("HG_COMMAND") or _DEFAULT_HG_COMMAND
 
@@ -208,12 +255,11 @@ class VcsEnvironment:
             "no",
         )
 
-        source_date_epoch_val = env.get("SOURCE_DATE_EPOCH")
+        source_date_epoch_val = settings_env.get("SOURCE_DATE_EPOCH")
         source_date_epoch: int | None = None
         if source_date_epoch_val is not None:
-            try:
-                source_date_epoch = int(source_date_epoch_val)
-            except ValueError:
+            source_date_epoch = _parse_int(source_date_epoch_val)
+            if source_date_epoch is None:
                 log.warning(
                     "Invalid SOURCE_DATE_EPOCH value '%s', ignoring",
                     source_date_epoch_val,
@@ -222,7 +268,7 @@ class VcsEnvironment:
         ignore_vcs_roots_raw = reader.read(
             "IGNORE_VCS_ROOTS", split=os.pathsep, default=[]
         )
-        ignore_vcs_roots = tuple(os.path.normcase(p) for p in ignore_vcs_roots_raw)
+        ignore_vcs_roots = tuple(map(os.path.normcase, ignore_vcs_roots_raw))
 
         debug = _parse_debug(reader.read("DEBUG"))
 
@@ -331,3 +377,9 @@ class VcsEnvironment:
         return _read_toml_overrides(
             dist_name, tool_names=self.tool_names, env=self._env
         )
+
+
+# field names accepted as overrides by GlobalOverrides.from_active
+_FIELD_NAMES = frozenset(
+    field.name for field in dataclasses.fields(VcsEnvironment) if field.init
+)
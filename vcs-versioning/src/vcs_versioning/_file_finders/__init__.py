@@ -95,7 +95,7 @@ def _read_ignore_vcs_roots(env: Mapping[str, str] | None = None) -> list[str]:
     )
     reader = EnvReader(tools_names=tool_names, env=env)
     raw = reader.read("IGNORE_VCS_ROOTS", split=os.pathsep, default=[])
-    return [os.path.normcase(p) for p in raw]
+    return list(map(os.path.normcase, raw))
 
 
 def is_toplevel_acceptable(
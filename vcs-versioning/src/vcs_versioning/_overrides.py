@@ -9,14 +9,11 @@ from __future__ import annotations
 import dataclasses
 import logging
 import os
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from datetime import date, datetime
-from difflib import get_close_matches
 from re import Pattern
 from typing import Any, TypedDict, get_type_hints
 
-from packaging.utils import canonicalize_name
-
 from . import _config
 from . import _types as _t
 from ._scm_version import ScmVersion, meta
@@ -78,6 +75,26 @@ PRETEND_METADATA_KEY = "SETUPTOOLS_SCM_PRETEND_METADATA"
 PRETEND_METADATA_KEY_NAMED = PRETEND_METADATA_KEY + "_FOR_{name}"
 
 
+def _group_env_vars_by_prefix(
+    prefixes: Sequence[str], env: Mapping[str, str]
+) -> dict[str, dict[str, str]]:
+    """Collect the environment variables starting with any of the prefixes.
+
+    The environment is scanned once, prefixes without any variable are left out.
+
+    Returns:
+        Mapping of prefix to the matching ``{env_var: value}`` items
+    """
+    prefix_tuple = tuple(prefixes)
+    grouped: dict[str, dict[str, str]] = {}
+    for env_var, value in env.items():
+        if env_var.startswith(prefix_tuple):
+            for prefix in prefix_tuple:
+                if env_var.startswith(prefix):
+                    grouped.setdefault(prefix, {})[env_var] = value
+    return grouped
+
+
 def _search_env_vars_with_prefix(
     prefix: str, dist_name: str, env: Mapping[str, str]
 ) -> list[tuple[str, str]]:
@@ -91,6 +108,8 @@ def _search_env_vars_with_prefix(
     Returns:
         List of (env_var_name, env_var_value) tuples for potential matches
     """
+    from packaging.utils import canonicalize_name
+
     # Get the canonical name for comparison
     canonical_dist_name = canonicalize_name(dist_name)
 
@@ -124,6 +143,9 @@ def _find_close_env_var_matches(
     Returns:
         List of environment variable names that are close matches
     """
+    # difflib is only needed to hint at typos, keep it off the import path
+    from difflib import get_close_matches
+
     candidates = []
     for env_var in env:
         if env_var.startswith(prefix):
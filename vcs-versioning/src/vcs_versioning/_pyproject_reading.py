@@ -7,7 +7,7 @@ import os
 import sys
 import warnings
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 if sys.version_info >= (3, 10):
@@ -20,6 +20,7 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
+from ._compat import DATACLASS_SLOTS
 from ._requirement_cls import extract_package_name
 from ._toml import TOML_RESULT, InvalidTomlError, read_toml_content
 
@@ -27,11 +28,14 @@ log = logging.getLogger(__name__)
 
 _ROOT = "root"
 
+# read-only default for lookups whose result never leaves read_pyproject
+_EMPTY: TOML_RESULT = {}
+
 
 DEFAULT_PYPROJECT_PATH = Path("pyproject.toml")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PyProjectData:
     """Core pyproject.toml data structure"""
 
@@ -44,6 +48,18 @@ class PyProjectData:
     project_present: bool
     build_requires: list[str]
     definition: TOML_RESULT
+    project_name: str | None = field(init=False, repr=False, compare=False)
+    project_version: str | None = field(init=False, repr=False, compare=False)
+    """the static version from [project] if present
+
+    When the project declares dynamic = ["version"], the version
+    is intentionally omitted from [project] and this is None.
+    """
+
+    def __post_init__(self) -> None:
+        # [project] is not changed after reading, resolve these once
+        self.project_name = self.project.get("name")
+        self.project_version = self.project.get("version")
 
     @classmethod
     def for_testing(
@@ -146,19 +162,6 @@ class PyProjectData:
         # but subclasses (like setuptools_scm's extended version) need Self
         return result  # type: ignore[return-value]
 
-    @property
-    def project_name(self) -> str | None:
-        return self.project.get("name")
-
-    @property
-    def project_version(self) -> str | None:
-        """Return the static version from [project] if present.
-
-        When the project declares dynamic = ["version"], the version
-        is intentionally omitted from [project] and this returns None.
-        """
-        return self.project.get("version")
-
 
 # Testing injection type for configuration reading
 GivenPyProjectResult: TypeAlias = (
@@ -213,27 +216,26 @@ def read_pyproject(
     else:
         defn = read_toml_content(path)
 
-    requires: list[str] = defn.get("build-system", {}).get("requires", [])
+    build_system = defn.get("build-system", _EMPTY)
+    requires: list[str] = build_system.get("requires") or []
     is_required = has_build_package(requires, canonical_build_package_name)
 
-    tool_section = defn.get("tool", {})
+    tool_section = defn.get("tool", _EMPTY)
 
     # Determine which tool names to try
     if tool_names is None:
         # Default: try vcs-versioning first, then setuptools_scm for backward compat
         tool_names = ["vcs-versioning", "setuptools_scm"]
 
-    # Try each tool name in order
-    section = {}
-    section_present = False
-    actual_tool_name = tool_names[0] if tool_names else "vcs-versioning"
-
-    for name in tool_names:
-        if name in tool_section:
-            section = tool_section[name]
-            section_present = True
-            actual_tool_name = name
-            break
+    # the first configured tool name wins
+    hits = [name for name in tool_names if name in tool_section]
+    section_present = bool(hits)
+    if section_present:
+        actual_tool_name = sys.intern(hits[0])
+        section = tool_section[actual_tool_name]
+    else:
+        actual_tool_name = tool_names[0] if tool_names else "vcs-versioning"
+        section = {}
 
     if not section_present and is_required:
         log.debug(
@@ -242,8 +244,10 @@ def read_pyproject(
             tool_names,
         )
 
-    project = defn.get("project", {})
-    project_present = "project" in defn
+    project = defn.get("project")
+    project_present = project is not None
+    if project is None:
+        project = {}
 
     pyproject_data = PyProjectData(
         path,
@@ -266,8 +270,16 @@ def get_args_for_pyproject(
     kwargs: TOML_RESULT,
 ) -> TOML_RESULT:
     """drops problematic details and figures the distribution name"""
-    section = pyproject.section.copy()
-    kwargs = kwargs.copy()
+    section = pyproject.section
+    if (
+        "relative_to" in section
+        or "dist_name" in section
+        or (_ROOT in kwargs and (kwargs[_ROOT] is None or _ROOT in section))
+    ):
+        # only copy when something below gets dropped,
+        # the result is a fresh dict either way
+        section = section.copy()
+        kwargs = kwargs.copy()
     if "relative_to" in section:
         relative = section.pop("relative_to")
         warnings.warn(
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
 import logging
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 __all__ = ["Requirement", "extract_package_name"]
 
-from packaging.requirements import Requirement
-from packaging.utils import canonicalize_name
+if TYPE_CHECKING:
+    from packaging.requirements import Requirement
 
 log = logging.getLogger(__name__)
 
+# PEP 508 name - a requirement string matching this is a bare name
+# and needs no full requirement parse
+_BARE_NAME = re.compile(
+    r"^([A-Z0-9]|[A-Z0-9][A-Z0-9._-]*[A-Z0-9])$", re.IGNORECASE | re.ASCII
+)
 
+
+def __getattr__(name: str) -> Any:
+    # packaging.requirements pulls in the full PEP 508 parser,
+    # only import it once someone actually needs it
+    if name == "Requirement":
+        from packaging.requirements import Requirement
+
+        return Requirement
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1024)
 def extract_package_name(requirement_string: str) -> str:
     """Extract the canonical package name from a requirement string.
 
     This function uses packaging.requirements.Requirement to properly parse
     the requirement and extract the package name, handling all edge cases
     that the custom regex-based approach might miss.
+    Bare names skip the requirement parser, results are memoized.
 
     Args:
         requirement_string: The requirement string to parse
@@ -23,4 +44,12 @@ def extract_package_name(requirement_string: str) -> str:
     Returns:
         The package name as a string
     """
+    from packaging.utils import canonicalize_name
+
+    bare_name = _BARE_NAME.match(requirement_string.strip())
+    if bare_name is not None:
+        return canonicalize_name(bare_name.group(1))
+
+    from packaging.requirements import Requirement
+
     return canonicalize_name(Requirement(requirement_string).name)
@@ -12,7 +12,10 @@ import logging
 import sys
 import warnings
 from collections.abc import Callable
+from contextlib import suppress
 from datetime import date, datetime
+from functools import lru_cache
+from re import Pattern
 from typing import TYPE_CHECKING, Any, TypedDict
 
 if sys.version_info >= (3, 10):
@@ -22,6 +25,7 @@ else:
 
 from . import _config
 from . import _version_cls as _v
+from ._compat import DATACLASS_SLOTS
 from ._node_utils import _format_node_for_output
 from ._version_cls import _Version
 
@@ -56,7 +60,23 @@ class VersionExpectations(TypedDict, total=False):
     time: datetime | None
 
 
-@dataclasses.dataclass
+# VersionExpectations keys, all but node_prefix are ScmVersion attributes
+_EXPECTATION_KEYS = frozenset(
+    {
+        "tag",
+        "distance",
+        "dirty",
+        "node_prefix",
+        "branch",
+        "exact",
+        "preformatted",
+        "node_date",
+        "time",
+    }
+)
+
+
+@dataclasses.dataclass(**DATACLASS_SLOTS)
 class mismatches:
     """Represents mismatches between expected and actual ScmVersion properties."""
 
@@ -91,42 +111,55 @@ class mismatches:
 def _parse_version_tag(
     tag: str | object, config: _config.Configuration
 ) -> _TagDict | None:
-    tag_str = str(tag)
-    tag_prefix = config.tag.prefix
-    if tag_prefix and tag_str.startswith(tag_prefix):
-        tag_str = tag_str[len(tag_prefix) :]
-    match = config.tag.regex.match(tag_str)
+    result = _match_version_tag(str(tag), config.tag.prefix, config.tag.regex)
+    if log.isEnabledFor(logging.DEBUG):
+        if result is None:
+            log.debug("tag %r did not parse", tag)
+        else:
+            log.debug("tag %r parsed to %r", tag, result)
+    return result
+
+
+@lru_cache(maxsize=256)
+def _match_version_tag(
+    tag_str: str, tag_prefix: str, tag_regex: Pattern[str]
+) -> _TagDict | None:
+    """Split a tag into prefix, version and suffix.
+
+    Results are cached and shared between callers, treat them as read-only.
+    """
+    unprefixed = tag_str
+    if tag_prefix and unprefixed.startswith(tag_prefix):
+        unprefixed = unprefixed[len(tag_prefix) :]
+    match = tag_regex.match(unprefixed)
 
     if match:
         key: str | int = 1 if len(match.groups()) == 1 else "version"
         full = match.group(0)
-        log.debug("%r %r %s", tag, config.tag.regex, match)
-        log.debug(
-            "key %s data %s, %s, %r", key, match.groupdict(), match.groups(), full
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%r %r %s", tag_str, tag_regex, match)
+            log.debug(
+                "key %s data %s, %s, %r", key, match.groupdict(), match.groups(), full
+            )
 
         if version := match.group(key):
-            result = _TagDict(
+            return _TagDict(
                 version=version,
                 prefix=full[: match.start(key)],
                 suffix=full[match.end(key) :],
             )
 
-            log.debug("tag %r parsed to %r", tag, result)
-            return result
-
         raise ValueError(
-            f'The tag_regex "{config.tag.regex.pattern}" matched tag "{tag}", '
+            f'The tag_regex "{tag_regex.pattern}" matched tag "{tag_str}", '
             "however the matched group has no value."
         )
     else:
-        log.debug("tag %r did not parse", tag)
-
         return None
 
 
 def callable_or_entrypoint(group: str, callable_or_name: str | Any) -> Any:
-    log.debug("ep %r %r", group, callable_or_name)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("ep %r %r", group, callable_or_name)
 
     if callable(callable_or_name):
         return callable_or_name
@@ -142,7 +175,10 @@ def tag_to_version(
     """
     take a tag that might be prefixed with a keyword and return only the version part
     """
-    log.debug("tag %s", tag)
+    # tags are converted one by one, skip building log records nobody sees
+    debug = log.isEnabledFor(logging.DEBUG)
+    if debug:
+        log.debug("tag %s", tag)
 
     tag_dict = _parse_version_tag(tag, config)
     if tag_dict is None or not tag_dict.get("version", None):
@@ -150,11 +186,27 @@ def tag_to_version(
         return None
 
     version_str = tag_dict["version"]
-    log.debug("version pre parse %s", version_str)
+    if debug:
+        log.debug("version pre parse %s", version_str)
+
+    version_with_suffix: _Version | None = None
+    if suffix := tag_dict.get("suffix", ""):
+        if debug:
+            log.debug("tag %r includes local build data %r, preserving it", tag, suffix)
+        # the suffix may be what is invalid, the base version is tried below
+        with suppress(Exception):
+            version_with_suffix = config.version_cls(version_str + suffix)
+            if debug:
+                log.debug("version with suffix=%r", version_with_suffix)
+        # a PEP 440 local label is only valid on a valid public version,
+        # so the base version needs no separate parse
+        if version_with_suffix is not None and suffix[0] == "+":
+            return version_with_suffix
 
     try:
         version: _Version = config.version_cls(version_str)
-        log.debug("version=%r", version)
+        if debug:
+            log.debug("version=%r", version)
     except Exception:
         warnings.warn(
             f"tag {tag!r} version {version_str!r} could not be parsed",
@@ -162,20 +214,12 @@ def tag_to_version(
         )
         return None
 
-    # If base version is valid, check if we can preserve the suffix
-    if suffix := tag_dict.get("suffix", ""):
-        log.debug("tag %r includes local build data %r, preserving it", tag, suffix)
-        # Try creating version with suffix - if it fails, we'll use the base version
-        try:
-            version_with_suffix: _Version = config.version_cls(version_str + suffix)
-            log.debug("version with suffix=%r", version_with_suffix)
+    if suffix:
+        if version_with_suffix is not None:
             return version_with_suffix
-        except Exception:
-            warnings.warn(
-                f"tag {tag!r} will be stripped of its suffix {suffix!r}", stacklevel=2
-            )
-            # Return the base version without suffix
-            return version
+        warnings.warn(
+            f"tag {tag!r} will be stripped of its suffix {suffix!r}", stacklevel=2
+        )
 
     return version
 
@@ -209,7 +253,7 @@ def _time_from_source_date_epoch(source_date_epoch: int | None) -> datetime:
     return datetime.now(timezone.utc)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**DATACLASS_SLOTS)
 class ScmVersion:
     """represents a parsed version from scm"""
 
@@ -301,53 +345,42 @@ class ScmVersion:
         Args:
             **expectations: Properties to check, using VersionExpectations TypedDict
         """
-        # Map expectation keys to ScmVersion attributes
-        attr_map: dict[str, Callable[[], Any]] = {
-            "tag": lambda: str(self.tag),
-            "node_prefix": lambda: self.node,
-            "distance": lambda: self.distance,
-            "dirty": lambda: self.dirty,
-            "branch": lambda: self.branch,
-            "exact": lambda: self.exact,
-            "preformatted": lambda: self.preformatted,
-            "node_date": lambda: self.node_date,
-            "time": lambda: self.time,
-        }
+        for key, exp_val in expectations.items():
+            act_val = self._expectation_value(key)
+            if key == "node_prefix":
+                if not act_val or not act_val.startswith(exp_val):
+                    break
+            elif str(exp_val) != str(act_val):
+                break
+        else:
+            return True
 
-        # Build actual values dict
+        # only build the reporting dicts once something did not match
+        expected = {k: str(v) if k == "tag" else v for k, v in expectations.items()}
         actual: dict[str, Any] = {
-            key: attr_map[key]() for key in expectations if key in attr_map
-        }
-
-        # Process expectations
-        expected = {
-            "tag" if k == "tag" else k: str(v) if k == "tag" else v
-            for k, v in expectations.items()
+            "node" if key == "node_prefix" else key: self._expectation_value(key)
+            for key in expectations
+            if key in _EXPECTATION_KEYS
         }
-
-        # Check for mismatches
-        def has_mismatch() -> bool:
-            for key, exp_val in expected.items():
-                if key == "node_prefix":
-                    act_val = actual.get("node_prefix")
-                    if not act_val or not act_val.startswith(exp_val):
-                        return True
-                else:
-                    if str(exp_val) != str(actual.get(key)):
-                        return True
-            return False
-
-        if has_mismatch():
-            # Rename node_prefix back to node for actual values in mismatch reporting
-            if "node_prefix" in actual:
-                actual["node"] = actual.pop("node_prefix")
-            return mismatches(expected=expected, actual=actual)
-        return True
+        return mismatches(expected=expected, actual=actual)
+
+    def _expectation_value(self, key: str) -> Any:
+        """Return the value of this version that `matches` compares `key` to."""
+        if key == "tag":
+            return str(self.tag)
+        if key == "node_prefix":
+            return self.node
+        if key in _EXPECTATION_KEYS:
+            return getattr(self, key)
+        return None
 
 
 def _parse_tag(
     tag: _Version | str, preformatted: bool, config: _config.Configuration
 ) -> _Version | None:
+    # exact type check first, most tags are already parsed by version_cls
+    if type(tag) is config.version_cls:
+        return tag
     if preformatted:
         if isinstance(tag, str):
             return _v.NonNormalizedVersion(tag)
@@ -384,7 +417,7 @@ def meta(
     time: datetime | None = None,
 ) -> ScmVersion:
     parsed_version: _Version | None
-    if preformatted and isinstance(tag, str):
+    if preformatted and type(tag) is str:
         parsed_version = _v.NonNormalizedVersion(tag)
     else:
         parsed_version = _parse_tag(tag, preformatted, config)
@@ -396,7 +429,8 @@ def meta(
             f" tag_prefix={config.tag.prefix!r})"
         )
 
-    log.info("version %s -> %s", tag, parsed_version)
+    if log.isEnabledFor(logging.INFO):
+        log.info("version %s -> %s", tag, parsed_version)
 
     kwargs: _ScmVersionKwargs = {
         "distance": distance,
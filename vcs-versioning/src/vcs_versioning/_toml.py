@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import logging
+import re
 import sys
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypedDict, TypeVar, cast, get_type_hints
 
@@ -36,7 +38,8 @@ class InvalidTomlSchemaError(ValueError):
 
 def read_toml_content(path: Path, default: TOML_RESULT | None = None) -> TOML_RESULT:
     try:
-        data = path.read_text(encoding="utf-8")
+        # bytes like tomllib.load - no newline translation or text buffering
+        data = path.read_bytes()
     except FileNotFoundError:
         if default is None:
             raise
@@ -45,9 +48,59 @@ def read_toml_content(path: Path, default: TOML_RESULT | None = None) -> TOML_RE
             return default
     else:
         try:
-            return load_toml(data)
+            parsed = _parse_toml_bytes(data)
         except Exception as e:  # tomllib/tomli raise different decode errors
             raise InvalidTomlError(f"Invalid TOML in {path}") from e
+        return _copy_tables(parsed)
+
+
+@lru_cache(maxsize=16)
+def _parse_toml_bytes(data: bytes) -> TOML_RESULT:
+    """Parse a TOML document, memoized by its content.
+
+    The same pyproject.toml is read several times per build.
+    Callers must only ever see copies, see `_copy_tables`.
+    """
+    return _intern_table_keys(load_toml(data.decode("utf-8")))
+
+
+def _copy_tables(data: TOML_RESULT) -> TOML_RESULT:
+    """Copy the mutable containers of a parsed TOML document.
+
+    Scalars (including dates and times) are immutable and shared.
+    """
+    return {k: _copy_value(v) for k, v in data.items()}
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _copy_tables(value)
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    return value
+
+
+def _intern_table_keys(data: TOML_RESULT) -> TOML_RESULT:
+    """Intern the keys of the top level and the [tool] table.
+
+    Section lookups like ``"vcs-versioning" in tool`` then hit the
+    identity check instead of comparing string contents.
+    """
+    tool = data.get("tool")
+    if isinstance(tool, dict):
+        data["tool"] = {sys.intern(k): v for k, v in tool.items()}
+    return {sys.intern(k): v for k, v in data.items()}
+
+
+# `{}` or `{key = "value"}` without escapes - the common shape of override
+# env vars, handled without running the TOML parser
+_SIMPLE_INLINE_MAP = re.compile(
+    r"\{[ \t]*(?:([A-Za-z0-9_-]+)[ \t]*=[ \t]*"
+    r"""(?:"([^"\\\x00-\x1f\x7f]*)"|'([^'\x00-\x1f\x7f]*)')[ \t]*)?\}"""
+)
+
+# field names per schema, resolving type hints is slow
+_SCHEMA_FIELDS: dict[type, frozenset[str]] = {}
 
 
 class _CheatTomlData(TypedDict):
@@ -73,24 +126,27 @@ def _validate_against_schema(
     if schema is None:
         return data
 
-    # Extract valid field names from the TypedDict
-    try:
-        valid_fields = frozenset(get_type_hints(schema).keys())
-    except (NameError, TypeError) as e:
-        # If type hints can't be resolved (e.g. PEP 604 unions on Python <3.10),
-        # fall back to __annotations__ keys directly
-        annotations = getattr(schema, "__annotations__", None)
-        if annotations:
-            valid_fields = frozenset(annotations.keys())
-        else:
-            log.warning("Could not resolve type hints for schema validation: %s", e)
-            return data
+    valid_fields = _SCHEMA_FIELDS.get(schema)
+    if valid_fields is None:
+        # Extract valid field names from the TypedDict
+        try:
+            valid_fields = frozenset(get_type_hints(schema).keys())
+        except (NameError, TypeError) as e:
+            # If type hints can't be resolved (e.g. PEP 604 unions on Python <3.10),
+            # fall back to __annotations__ keys directly
+            annotations = getattr(schema, "__annotations__", None)
+            if annotations:
+                valid_fields = frozenset(annotations.keys())
+            else:
+                log.warning("Could not resolve type hints for schema validation: %s", e)
+                return data
+        _SCHEMA_FIELDS[schema] = valid_fields
 
     # If the schema has no fields (empty TypedDict), skip validation
     if not valid_fields:
         return data
 
-    invalid_fields = set(data.keys()) - valid_fields
+    invalid_fields = data.keys() - valid_fields
     if invalid_fields:
         log.warning(
             "Invalid fields in TOML data: %s. Valid fields are: %s",
@@ -120,6 +176,13 @@ def load_toml_or_inline_map(data: str | None, *, schema: type[TSchema]) -> TSche
     """
     if not data:
         return {}  # type: ignore[return-value]
+    if len(data) < 128 and (simple := _SIMPLE_INLINE_MAP.fullmatch(data)):
+        key, basic_value, literal_value = simple.groups()
+        if key is None:
+            return {}  # type: ignore[return-value]
+        value = basic_value if basic_value is not None else literal_value
+        result = _validate_against_schema({key: value}, schema)
+        return result  # type: ignore[return-value]
     try:
         if data[0] == "{":
             data = "cheat=" + data
@@ -7,6 +7,7 @@ version numbers are calculated and formatted from SCM metadata.
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 
 from .. import _entrypoints
 from .._exceptions import DirtyWorkingTreeError
@@ -97,33 +98,35 @@ def format_version(version: ScmVersion) -> str:
     if version.preformatted:
         return str(version.tag)
 
+    config = version.config
+    tag = version.tag
+
     # Extract original tag's local data for later combination
-    original_local = ""
-    if hasattr(version.tag, "local") and version.tag.local is not None:
-        original_local = str(version.tag.local)
+    local = getattr(tag, "local", None)
+    original_local = "" if local is None else str(local)
 
     # Create a patched ScmVersion with only the base version (no local data) for version schemes
-    from dataclasses import replace
-
     # Extract the base version (public part) from the tag using config's version_cls
-    base_version_str = str(version.tag.public)
-    base_tag = version.config.version_cls(base_version_str)
+    base_tag = config.version_cls(str(tag.public))
     version_for_scheme = replace(version, tag=base_tag)
 
     main_version = _entrypoints._call_version_scheme(
         version_for_scheme,
         "setuptools_scm.version_scheme",
-        version.config.version_scheme,
+        config.version_scheme,
     )
     log.debug("version %s", main_version)
     assert main_version is not None
 
     local_version = _entrypoints._call_version_scheme(
-        version, "setuptools_scm.local_scheme", version.config.local_scheme, "+unknown"
+        version, "setuptools_scm.local_scheme", config.local_scheme, "+unknown"
     )
     log.debug("local_version %s", local_version)
 
+    main_version = str(main_version)
+    if not original_local and not local_version and "+" not in main_version:
+        # nothing to combine
+        return main_version
+
     # Combine main version with original local data and new local scheme data
-    return combine_version_with_local_parts(
-        str(main_version), original_local, local_version
-    )
+    return combine_version_with_local_parts(main_version, original_local, local_version)
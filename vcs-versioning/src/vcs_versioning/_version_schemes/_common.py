@@ -29,19 +29,32 @@ def combine_version_with_local_parts(
         combine_version_with_local_parts("1.2.0+build.123", "build.123") -> "1.2.0+build.123"  # no duplication
         combine_version_with_local_parts("1.2.0", None, None) -> "1.2.0"
     """
+    has_local = "+" in main_version
+    new_parts = [part for part in local_parts if part and part.strip()]
+    if not has_local:
+        # fast paths - nothing to add, or a single part without repeats
+        if not new_parts:
+            return main_version
+        if len(new_parts) == 1:
+            clean_part = new_parts[0].strip("+")
+            if not clean_part:
+                return main_version
+            segments = clean_part.split(".")
+            if "" not in segments and len(set(segments)) == len(segments):
+                return main_version + "+" + clean_part
+
     # Split main version into base and existing local parts
-    if "+" in main_version:
+    if has_local:
         main_part, existing_local = main_version.split("+", 1)
         all_local_parts = existing_local.split(".")
     else:
         main_part = main_version
         all_local_parts = []
+    # membership checks against a set, the list keeps the order
+    seen = set(all_local_parts)
 
     # Process each new local part
-    for part in local_parts:
-        if not part or not part.strip():
-            continue
-
+    for part in new_parts:
         # Strip any leading + and split into segments
         clean_part = part.strip("+")
         if not clean_part:
@@ -52,8 +65,9 @@ def combine_version_with_local_parts(
 
         # Add each segment if not already present
         for segment in part_segments:
-            if segment and segment not in all_local_parts:
+            if segment and segment not in seen:
                 all_local_parts.append(segment)
+                seen.add(segment)
 
     # Return combined result
     if all_local_parts:
@@ -9,8 +9,9 @@ from __future__ import annotations
 import logging
 import re
 import warnings
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, timedelta
 from re import Match
+from typing import TypedDict
 
 from .. import _modify_version
 from .._exceptions import DirtyWorkingTreeError
@@ -40,19 +41,26 @@ def guess_next_dev_version(version: ScmVersion) -> str:
 def guess_next_simple_semver(
     version: ScmVersion, retain: int, increment: bool = True
 ) -> str:
+    release = version.tag.release
     if increment and getattr(version.tag, "dev", None) == 0:
-        parts = list(version.tag.release)
-        while len(parts) < SEMVER_LEN:
-            parts.append(0)
-        return ".".join(str(i) for i in parts)
-    parts = list(version.tag.release[:retain])
-    while len(parts) < retain:
-        parts.append(0)
+        parts = [*release, *[0] * (SEMVER_LEN - len(release))]
+        return ".".join(map(str, parts))
+    bump = 1 if increment else 0
+    # the semver schemes only ever retain minor or patch, format those directly
+    if retain == SEMVER_PATCH:
+        major = release[0] if len(release) > 0 else 0
+        minor = release[1] if len(release) > 1 else 0
+        patch = release[2] if len(release) > 2 else 0
+        return f"{major}.{minor}.{patch + bump}"
+    if retain == SEMVER_MINOR:
+        major = release[0] if len(release) > 0 else 0
+        minor = release[1] if len(release) > 1 else 0
+        return f"{major}.{minor + bump}.0"
+    parts = [*release[:retain], *[0] * (retain - len(release))]
     if increment:
         parts[-1] += 1
-    while len(parts) < SEMVER_LEN:
-        parts.append(0)
-    return ".".join(str(i) for i in parts)
+    parts += [0] * (SEMVER_LEN - retain)
+    return ".".join(map(str, parts))
 
 
 def simplified_semver_version(version: ScmVersion) -> str:
@@ -71,7 +79,7 @@ def release_branch_semver_version(version: ScmVersion) -> str:
     if version.branch is not None:
         # Does the branch name (stripped of namespace) parse as a version?
         branch_ver_data = _parse_version_tag(
-            version.branch.split("/")[-1], version.config
+            version.branch.rpartition("/")[2], version.config
         )
         if branch_ver_data is not None:
             branch_ver = branch_ver_data["version"]
@@ -149,6 +157,62 @@ def date_ver_match(ver: str) -> Match[str] | None:
     return _DATE_REGEX.match(ver)
 
 
+class _DateVer(TypedDict):
+    prefix: str
+    year: str
+    date: str
+    patch: str | None
+
+
+def _date_ver_parts(ver: str) -> _DateVer | None:
+    """The groups of ``_DATE_REGEX`` for ``ver``, plain dotted dates skip the regex"""
+    prefix = ver[:1] if ver[:1] in ("v", "V") else ""
+    parts = ver[len(prefix) :].split(".")
+    if (
+        len(parts) in (3, 4)
+        and len(parts[0]) in (2, 4)
+        and 0 < len(parts[1]) <= 2
+        and 0 < len(parts[2]) <= 2
+        and all(part.isdecimal() for part in parts[:3])
+    ):
+        if len(parts) == 3:
+            return _DateVer(prefix=prefix, year=parts[0], date=ver, patch=None)
+        patch = parts[3]
+        if not patch or patch.isdecimal():
+            date_str = ver[: -len(patch) - 1]
+            return _DateVer(prefix=prefix, year=parts[0], date=date_str, patch=patch)
+
+    match = _DATE_REGEX.match(ver)
+    if match is None:
+        return None
+    return _DateVer(
+        prefix=match.group("prefix"),
+        year=match.group("year"),
+        date=match.group("date"),
+        patch=match.group("patch"),
+    )
+
+
+# year digits of the formats _parse_tag_date handles without strptime
+_SIMPLE_DATE_FORMATS = {"%Y.%m.%d": 4, "%y.%m.%d": 2}
+
+
+def _parse_tag_date(date_str: str, prefix: str, date_fmt: str) -> date:
+    """Parse the date of a tag matched by ``_DATE_REGEX`` using ``date_fmt``.
+
+    The default formats are split by hand, strptime handles anything else.
+    """
+    year_digits = _SIMPLE_DATE_FORMATS.get(date_fmt[len(prefix) :])
+    year, month, day = date_str[len(prefix) :].split(".")
+    if year_digits == len(year):
+        year_num = int(year)
+        if year_digits == 2:
+            # same pivot as strptime's %y
+            year_num += 2000 if year_num < 69 else 1900
+        return date(year_num, int(month), int(day))
+    return datetime.strptime(date_str, date_fmt).date()
+
+
 def guess_next_date_ver(
     version: ScmVersion,
     node_date: date | None = None,
@@ -161,7 +225,7 @@ def guess_next_date_ver(
 
     distance is always added as .devX
     """
-    match = date_ver_match(str(version.tag))
+    match = _date_ver_parts(str(version.tag))
     if match is None:
         warnings.warn(
             f"{version} does not correspond to a valid versioning date, "
@@ -173,8 +237,8 @@ def guess_next_date_ver(
     else:
         # deduct date format if not provided
         if date_fmt is None:
-            date_fmt = "%Y.%m.%d" if len(match.group("year")) == 4 else "%y.%m.%d"
-        if (prefix := match.group("prefix")) and not date_fmt.startswith(prefix):
+            date_fmt = "%Y.%m.%d" if len(match["year"]) == 4 else "%y.%m.%d"
+        if (prefix := match["prefix"]) and not date_fmt.startswith(prefix):
             date_fmt = prefix + date_fmt
 
     today = version.time.date()
@@ -185,15 +249,11 @@ def guess_next_date_ver(
         # Use yesterday to ensure tag_date != head_date
         tag_date = head_date - timedelta(days=1)
     else:
-        tag_date = (
-            datetime.strptime(match.group("date"), date_fmt)
-            .replace(tzinfo=timezone.utc)
-            .date()
-        )
+        tag_date = _parse_tag_date(match["date"], match["prefix"], date_fmt)
     if tag_date == head_date:
         assert match is not None
         # Same day as existing date tag - increment patch
-        patch = int(match.group("patch") or "0") + 1
+        patch = int(match["patch"] or "0") + 1
     else:
         # Different day or legacy non-date tag - use patch 0
         if tag_date > head_date and match is not None:
@@ -218,11 +278,11 @@ def calver_by_date(version: ScmVersion) -> str:
         return version.format_with("{tag}")
     # TODO: move the release-X check to a new scheme
     if version.branch is not None and version.branch.startswith("release-"):
-        branch_ver = _parse_version_tag(version.branch.split("-")[-1], version.config)
+        branch_suffix = version.branch.rpartition("-")[2]
+        branch_ver = _parse_version_tag(branch_suffix, version.config)
         if branch_ver is not None:
             ver = branch_ver["version"]
-            match = date_ver_match(ver)
-            if match:
+            if _date_ver_parts(ver) is not None:
                 return ver
     return version.format_next_version(
         guess_next_date_ver,
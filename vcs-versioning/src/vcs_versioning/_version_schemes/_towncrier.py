@@ -13,8 +13,12 @@ Falls back to guess-next-dev if no fragments are found.
 from __future__ import annotations
 
 import logging
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 
+from .. import _modify_version
 from .._scm_version import ScmVersion
 from .._toml import read_toml_content
 from ._common import SEMVER_MINOR, SEMVER_PATCH
@@ -25,12 +29,17 @@ log = logging.getLogger(__name__)
 DEFAULT_FRAGMENT_DIRECTORY = "changelog.d"
 
 # Fragment types that indicate different version bumps
-MAJOR_FRAGMENT_TYPES = {"major", "breaking", "removal"}
-MINOR_FRAGMENT_TYPES = {"feature", "deprecation"}
-PATCH_FRAGMENT_TYPES = {"bugfix", "doc", "misc"}
+MAJOR_FRAGMENT_TYPES = frozenset({"major", "breaking", "removal"})
+MINOR_FRAGMENT_TYPES = frozenset({"feature", "deprecation"})
+PATCH_FRAGMENT_TYPES = frozenset({"bugfix", "doc", "misc"})
 
 ALL_FRAGMENT_TYPES = MAJOR_FRAGMENT_TYPES | MINOR_FRAGMENT_TYPES | PATCH_FRAGMENT_TYPES
 
+_SKIPPED_FILES = frozenset({"template.md", "README.md", ".gitkeep"})
+
+# fragment directory listings are cached by mtime once it is older than this
+_RACY_MTIME_NS = 2_000_000_000
+
 
 def _resolve_fragment_directory(root: Path) -> str:
     """Resolve the towncrier fragment directory from config files.
@@ -69,28 +78,51 @@ def _find_fragments(
     Returns:
         Dictionary mapping fragment types to lists of fragment filenames
     """
-    fragments: dict[str, list[str]] = {ftype: [] for ftype in ALL_FRAGMENT_TYPES}
-
     changelog_path = root / changelog_dir
-    if not changelog_path.exists():
+    try:
+        mtime_ns = changelog_path.stat().st_mtime_ns
+    except OSError:
         log.debug("No changelog directory found at %s", changelog_path)
-        return fragments
+        return {ftype: [] for ftype in ALL_FRAGMENT_TYPES}
 
-    for entry in changelog_path.iterdir():
-        if not entry.is_file():
-            continue
+    if time.time_ns() - mtime_ns < _RACY_MTIME_NS:
+        # entries added within the same timestamp tick would not
+        # change the mtime, only trust it once it is old enough
+        fragments = _scan_fragments(changelog_path)
+    else:
+        fragments = _scan_fragments_cached(changelog_path, mtime_ns)
+    return {ftype: list(files) for ftype, files in fragments.items()}
+
+
+@lru_cache(maxsize=32)
+def _scan_fragments_cached(changelog_path: Path, mtime_ns: int) -> dict[str, list[str]]:
+    return _scan_fragments(changelog_path)
 
-        # Skip template, README, and .gitkeep files
-        if entry.name in ("template.md", "README.md", ".gitkeep"):
-            continue
 
-        # Fragment naming: {number}.{type}.md
-        parts = entry.name.split(".")
-        if len(parts) >= 2:
-            fragment_type = parts[1]
+def _scan_fragments(changelog_path: Path) -> dict[str, list[str]]:
+    fragments: dict[str, list[str]] = {ftype: [] for ftype in ALL_FRAGMENT_TYPES}
+    # scandir entries know their type from the listing, no stat per file
+    with os.scandir(changelog_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            name = entry.name
+
+            # Skip template, README, and .gitkeep files
+            if name in _SKIPPED_FILES:
+                continue
+
+            # Fragment naming: {number}.{type}.md
+            first = name.find(".")
+            if first < 0:
+                continue
+            second = name.find(".", first + 1)
+            if second < 0:
+                second = len(name)
+            fragment_type = name[first + 1 : second]
             if fragment_type in ALL_FRAGMENT_TYPES:
-                fragments[fragment_type].append(entry.name)
-                log.debug("Found %s fragment: %s", fragment_type, entry.name)
+                fragments[fragment_type].append(name)
+                log.debug("Found %s fragment: %s", fragment_type, name)
 
     return fragments
 
@@ -101,23 +133,22 @@ def _determine_bump_type(fragments: dict[str, list[str]]) -> str | None:
     Returns:
         'major', 'minor', 'patch', or None if no fragments found
     """
-    # Check for any fragments at all
-    total_fragments = sum(len(files) for files in fragments.values())
-    if total_fragments == 0:
-        return None
-
-    # Major bump if any removal fragments
-    if any(fragments[ftype] for ftype in MAJOR_FRAGMENT_TYPES):
-        return "major"
-
-    # Minor bump if any feature/deprecation fragments
-    if any(fragments[ftype] for ftype in MINOR_FRAGMENT_TYPES):
+    # a single pass, any major fragment decides right away
+    has_minor = has_patch = False
+    for ftype, files in fragments.items():
+        if not files:
+            continue
+        if ftype in MAJOR_FRAGMENT_TYPES:
+            return "major"
+        if ftype in MINOR_FRAGMENT_TYPES:
+            has_minor = True
+        elif ftype in PATCH_FRAGMENT_TYPES:
+            has_patch = True
+
+    if has_minor:
         return "minor"
-
-    # Patch bump for other fragments
-    if any(fragments[ftype] for ftype in PATCH_FRAGMENT_TYPES):
+    if has_patch:
         return "patch"
-
     return None
 
 
@@ -127,15 +158,14 @@ def _get_changelog_root(version: ScmVersion) -> Path:
     For monorepo support, prefers relative_to (config file location).
     Falls back to absolute_root (VCS root).
     """
-    import os
-
-    if version.config.relative_to:
+    relative_to = version.config.relative_to
+    if relative_to:
         # relative_to is typically the pyproject.toml file path
         # changelog.d/ should be in the same directory
-        if os.path.isfile(version.config.relative_to):
-            return Path(os.path.dirname(version.config.relative_to))
+        if os.path.isfile(relative_to):
+            return Path(os.path.dirname(relative_to))
         else:
-            return Path(version.config.relative_to)
+            return Path(relative_to)
     else:
         # When no relative_to is set, use absolute_root (the VCS root)
         return Path(version.config.absolute_root)
@@ -143,8 +173,6 @@ def _get_changelog_root(version: ScmVersion) -> Path:
 
 def _guess_next_major(version: ScmVersion) -> str:
     """Guess next major version (X+1.0.0) from current tag."""
-    from .. import _modify_version
-
     tag_version = _modify_version.strip_local(str(version.tag))
     parts = tag_version.split(".")
     if len(parts) >= 1:
@@ -155,6 +183,28 @@ def _guess_next_major(version: ScmVersion) -> str:
     return bumped if bumped is not None else f"{tag_version}.dev0"
 
 
+def _fragment_bump_type(version: ScmVersion) -> str | None:
+    root = _get_changelog_root(version)
+    log.debug("Analyzing fragments in %s", root)
+
+    changelog_dir = _resolve_fragment_directory(root)
+    fragments = _find_fragments(root, changelog_dir=changelog_dir)
+    return _determine_bump_type(fragments)
+
+
+def _format_bump(version: ScmVersion, bump_type: str, fmt: str | None = None) -> str:
+    """Format the next version for a bump type, ``fmt`` replaces the default"""
+    if bump_type == "major":
+        if fmt is None:
+            return version.format_next_version(_guess_next_major)
+        return version.format_next_version(_guess_next_major, fmt)
+
+    retain = SEMVER_MINOR if bump_type == "minor" else SEMVER_PATCH
+    if fmt is None:
+        return version.format_next_version(guess_next_simple_semver, retain=retain)
+    return version.format_next_version(guess_next_simple_semver, fmt, retain=retain)
+
+
 def version_from_fragments(version: ScmVersion) -> str:
     """Version scheme that determines version from towncrier fragments.
 
@@ -170,33 +220,14 @@ def version_from_fragments(version: ScmVersion) -> str:
     if version.exact:
         return version.format_with("{tag}")
 
-    root = _get_changelog_root(version)
-    log.debug("Analyzing fragments in %s", root)
-
-    # Find and analyze fragments
-    changelog_dir = _resolve_fragment_directory(root)
-    fragments = _find_fragments(root, changelog_dir=changelog_dir)
-    bump_type = _determine_bump_type(fragments)
+    bump_type = _fragment_bump_type(version)
 
     if bump_type is None:
         log.debug("No fragments found, falling back to guess-next-dev")
         return guess_next_dev_version(version)
 
     log.info("Determined version bump type from fragments: %s", bump_type)
-
-    # Determine the next version based on bump type
-    if bump_type == "major":
-        return version.format_next_version(_guess_next_major)
-
-    elif bump_type == "minor":
-        return version.format_next_version(
-            guess_next_simple_semver, retain=SEMVER_MINOR
-        )
-
-    else:  # patch
-        return version.format_next_version(
-            guess_next_simple_semver, retain=SEMVER_PATCH
-        )
+    return _format_bump(version, bump_type)
 
 
 def get_release_version(version: ScmVersion) -> str | None:
@@ -215,12 +246,7 @@ def get_release_version(version: ScmVersion) -> str | None:
     if version.exact:
         return version.format_with("{tag}")
 
-    root = _get_changelog_root(version)
-    log.debug("Analyzing fragments for release version in %s", root)
-
-    changelog_dir = _resolve_fragment_directory(root)
-    fragments = _find_fragments(root, changelog_dir=changelog_dir)
-    bump_type = _determine_bump_type(fragments)
+    bump_type = _fragment_bump_type(version)
 
     if bump_type is None:
         log.debug("No fragments found, cannot determine release version")
@@ -229,15 +255,4 @@ def get_release_version(version: ScmVersion) -> str | None:
     log.info("Determined release version bump type from fragments: %s", bump_type)
 
     # KEY DIFFERENCE: Use fmt="{guessed}" for clean version (no .devN)
-    if bump_type == "major":
-        return version.format_next_version(_guess_next_major, fmt="{guessed}")
-
-    elif bump_type == "minor":
-        return version.format_next_version(
-            guess_next_simple_semver, fmt="{guessed}", retain=SEMVER_MINOR
-        )
-
-    else:  # patch
-        return version.format_next_version(
-            guess_next_simple_semver, fmt="{guessed}", retain=SEMVER_PATCH
-        )
+    return _format_bump(version, bump_type, fmt="{guessed}")
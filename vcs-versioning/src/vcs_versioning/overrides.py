@@ -18,12 +18,14 @@ See the integrators documentation for more details.
 from __future__ import annotations
 
 import contextvars
+import dataclasses
 import logging
 import os
 import sys
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from contextlib import ContextDecorator
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar, overload
 
 if sys.version_info >= (3, 11):
@@ -31,10 +33,9 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
-from packaging.utils import canonicalize_name
-
 from ._overrides import (
     _find_close_env_var_matches,
+    _group_env_vars_by_prefix,
     _search_env_vars_with_prefix,
 )
 from ._toml import load_toml_or_inline_map
@@ -50,6 +51,52 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _env_var_dist_name(dist_name: str) -> tuple[str, str]:
+    """Canonical dist name and its env var spelling (e.g. MY_PACKAGE)."""
+    # packaging.utils pulls in packaging.tags, only needed with a dist name
+    from packaging.utils import canonicalize_name
+
+    canonical_dist_name = canonicalize_name(dist_name)
+    return canonical_dist_name, canonical_dist_name.replace("-", "_").upper()
+
+
+@lru_cache(maxsize=128)
+def _env_var_names(tools_names: tuple[str, ...], name: str) -> tuple[str, ...]:
+    """Generic env var names for ``name``, one per tool in order."""
+    # interned once here, lookups on every read can then match by identity
+    return tuple(sys.intern(f"{tool}_{name}") for tool in tools_names)
+
+
+@lru_cache(maxsize=128)
+def _dist_env_var_prefixes(tools_names: tuple[str, ...], name: str) -> tuple[str, ...]:
+    """Prefixes of the dist-specific env var names, one per tool in order."""
+    return tuple(f"{tool}_{name}_FOR_" for tool in tools_names)
+
+
+@lru_cache(maxsize=128)
+def _dist_env_var_names(
+    tools_names: tuple[str, ...], name: str, dist_name: str
+) -> tuple[str, ...]:
+    """Dist-specific env var names for ``name``, one per tool in order."""
+    env_var_dist_name = _env_var_dist_name(dist_name)[1]
+    return tuple(
+        sys.intern(prefix + env_var_dist_name)
+        for prefix in _dist_env_var_prefixes(tools_names, name)
+    )
+
+
+@lru_cache(maxsize=128)
+def _candidate_env_var_names(
+    tools_names: tuple[str, ...], name: str, dist_name: str | None
+) -> tuple[str, ...]:
+    """All env var names EnvReader.read tries for ``name``, in lookup order."""
+    generic = _env_var_names(tools_names, name)
+    if dist_name is None:
+        return generic
+    return _dist_env_var_names(tools_names, name, dist_name) + generic
+
+
 class EnvReader:
     """Helper class to read environment variables with tool prefix fallback.
 
@@ -71,26 +118,29 @@ class EnvReader:
         >>> pretend = reader.read("PRETEND_VERSION")  # tries dist-specific first, then generic
     """
 
+    __slots__ = ("dist_name", "env", "tools_names")
+
     tools_names: tuple[str, ...]
     env: Mapping[str, str]
     dist_name: str | None
 
     def __init__(
         self,
-        tools_names: tuple[str, ...],
+        tools_names: Sequence[str],
         env: Mapping[str, str],
         dist_name: str | None = None,
     ):
         """Initialize the EnvReader.
 
         Args:
-            tools_names: Tuple of tool prefixes to try in order (e.g., ("HATCH_VCS", "VCS_VERSIONING"))
+            tools_names: Sequence of tool prefixes to try in order (e.g., ("HATCH_VCS", "VCS_VERSIONING"))
             env: Environment mapping to read from
             dist_name: Optional distribution name for dist-specific variables
         """
         if not tools_names:
             raise TypeError("tools_names must be a non-empty tuple")
-        self.tools_names = tools_names
+        # the name lookups are cached per tools_names, which must be hashable
+        self.tools_names = tuple(tools_names)
         self.env = env
         self.dist_name = dist_name
 
@@ -128,40 +178,37 @@ class EnvReader:
             - If split is None and value found: str value
             - If split is None and not found: default value
         """
-        # If dist_name is provided, try dist-specific variants first
+        # If dist_name is provided, dist-specific variants come first,
+        # then the generic versions for each tool
         found_value: str | None = None
-        if self.dist_name is not None:
-            canonical_dist_name = canonicalize_name(self.dist_name)
-            env_var_dist_name = canonical_dist_name.replace("-", "_").upper()
-
-            # Try each tool's dist-specific variant
-            for tool in self.tools_names:
-                expected_env_var = f"{tool}_{name}_FOR_{env_var_dist_name}"
-                val = self.env.get(expected_env_var)
-                if val is not None:
-                    found_value = val
-                    break
-
-        # Try generic versions for each tool
-        if found_value is None:
-            for tool in self.tools_names:
-                val = self.env.get(f"{tool}_{name}")
-                if val is not None:
-                    found_value = val
-                    break
+        for env_var in _candidate_env_var_names(self.tools_names, name, self.dist_name):
+            val = self.env.get(env_var)
+            if val is not None:
+                found_value = val
+                break
 
         # Not found - if dist_name is provided, check for common mistakes
         if found_value is None and self.dist_name is not None:
-            canonical_dist_name = canonicalize_name(self.dist_name)
-            env_var_dist_name = canonical_dist_name.replace("-", "_").upper()
+            canonical_dist_name, env_var_dist_name = _env_var_dist_name(self.dist_name)
+
+            # a single pass over the environment collects the candidates
+            # of every prefix, usually there are none to match against
+            prefixes = _dist_env_var_prefixes(self.tools_names, name)
+            candidates_by_prefix = _group_env_vars_by_prefix(prefixes, self.env)
 
             # Try each tool prefix for fuzzy matching
-            for tool in self.tools_names:
-                expected_env_var = f"{tool}_{name}_FOR_{env_var_dist_name}"
-                prefix = f"{tool}_{name}_FOR_"
+            for prefix, expected_env_var in zip(
+                prefixes,
+                _dist_env_var_names(self.tools_names, name, self.dist_name),
+            ):
+                candidates = candidates_by_prefix.get(prefix)
+                if not candidates:
+                    continue
 
                 # Search for alternative normalizations
-                matches = _search_env_vars_with_prefix(prefix, self.dist_name, self.env)
+                matches = _search_env_vars_with_prefix(
+                    prefix, self.dist_name, candidates
+                )
                 if matches:
                     env_var_name, value = matches[0]
                     log.warning(
@@ -181,9 +228,12 @@ class EnvReader:
                     found_value = value
                     break
 
-                # Search for close matches (potential typos)
+                # Search for close matches (potential typos), they are only
+                # ever reported, skip difflib when the warning would be dropped
+                if not log.isEnabledFor(logging.WARNING):
+                    continue
                 close_matches = _find_close_env_var_matches(
-                    prefix, env_var_dist_name, self.env
+                    prefix, env_var_dist_name, candidates
                 )
                 if close_matches:
                     log.warning(
@@ -268,7 +318,7 @@ class GlobalOverrides:
             version = get_version(...)
     """
 
-    __slots__ = ("_token", "dist_name", "tool", "vcs_env")
+    __slots__ = ("_tokens", "dist_name", "tool", "vcs_env")
 
     def __init__(
         self,
@@ -279,7 +329,8 @@ class GlobalOverrides:
         self.vcs_env = vcs_env
         self.tool = tool
         self.dist_name = dist_name
-        self._token: contextvars.Token[GlobalOverrides | None] | None = None
+        # one token per active __enter__, the same instance may be nested
+        self._tokens: list[contextvars.Token[GlobalOverrides | None]] = []
 
     # ------------------------------------------------------------------
     # Backward-compatible properties delegating to vcs_env
@@ -340,8 +391,6 @@ class GlobalOverrides:
         Returns:
             GlobalOverrides instance ready to use as context manager
         """
-        import dataclasses as dc
-
         from ._environment import VcsEnvironment
 
         vcs_env = VcsEnvironment.from_env(tool, env=env, dist_name=dist_name)
@@ -355,7 +404,7 @@ class GlobalOverrides:
             logger_tuple = ()
 
         if logger_tuple:
-            vcs_env = dc.replace(vcs_env, additional_loggers=logger_tuple)
+            vcs_env = dataclasses.replace(vcs_env, additional_loggers=logger_tuple)
 
         return cls(
             vcs_env=vcs_env,
@@ -369,15 +418,14 @@ class GlobalOverrides:
 
     def __enter__(self) -> Self:
         """Enter context: set this as the active override and configure logging."""
-        self._token = _active_overrides.set(self)
+        self._tokens.append(_active_overrides.set(self))
         self.vcs_env.configure_logging()
         return self
 
     def __exit__(self, *exc_info: object) -> None:
         """Exit context: restore previous override state."""
-        if self._token is not None:
-            _active_overrides.reset(self._token)
-            self._token = None
+        if self._tokens:
+            _active_overrides.reset(self._tokens.pop())
 
     # ------------------------------------------------------------------
     # Utilities
@@ -405,9 +453,7 @@ class GlobalOverrides:
         Raises:
             RuntimeError: If no GlobalOverrides context is currently active
         """
-        import dataclasses as dc
-
-        from ._environment import VcsEnvironment
+        from ._environment import _FIELD_NAMES, VcsEnvironment
 
         active = _active_overrides.get()
         if active is None:
@@ -425,11 +471,10 @@ class GlobalOverrides:
             vcs_env = active.vcs_env
 
         # Remaining changes are VcsEnvironment field overrides (includes additional_loggers)
-        vcs_env_fields = {f.name for f in dc.fields(VcsEnvironment)}
-        env_changes = {k: v for k, v in changes.items() if k in vcs_env_fields}
+        env_changes = {k: v for k, v in changes.items() if k in _FIELD_NAMES}
         if env_changes:
             prior_overrides = vcs_env._explicit_overrides
-            vcs_env = dc.replace(
+            vcs_env = dataclasses.replace(
                 vcs_env,
                 **env_changes,
                 _explicit_overrides=prior_overrides | frozenset(env_changes),
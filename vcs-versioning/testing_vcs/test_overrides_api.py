@@ -158,6 +158,19 @@ def test_nested_from_active_contexts() -> None:
         assert get_active().debug == logging.DEBUG
 
 
+def test_same_instance_nested_contexts() -> None:
+    """Test that one instance can be entered again while already active."""
+    from vcs_versioning.overrides import _active_overrides
+
+    outer = _active_overrides.get()
+    overrides = GlobalOverrides.from_env("TEST", env={})
+    with overrides:
+        with overrides:
+            assert _active_overrides.get() is overrides
+        assert _active_overrides.get() is overrides
+    assert _active_overrides.get() is outer
+
+
 def test_export_without_source_date_epoch() -> None:
     """Test that export() handles None source_date_epoch correctly."""
     overrides = GlobalOverrides.from_env("TEST", env={})
@@ -368,6 +381,14 @@ class TestEnvReader:
         reader = EnvReader(tools_names=("TOOL_A", "TOOL_B"), env=env)
         assert reader.read("DEBUG") == "1"
 
+    def test_read_with_tools_names_list(self) -> None:
+        """Test that tools_names may be any sequence, not just a tuple."""
+        from vcs_versioning.overrides import EnvReader
+
+        reader = EnvReader(tools_names=["TOOL_A", "TOOL_B"], env={"TOOL_B_DEBUG": "1"})
+        assert reader.tools_names == ("TOOL_A", "TOOL_B")
+        assert reader.read("DEBUG") == "1"
+
     def test_read_generic_fallback_to_second_tool(self) -> None:
         """Test falling back to second tool when first not found."""
         from vcs_versioning.overrides import EnvReader
@@ -524,6 +545,29 @@ class TestEnvReader:
             "version_scheme": "semver-pep440-release-branch",
         }
 
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("{}", {}),
+            (
+                "{ local_scheme = 'no-local-version' }",
+                {"local_scheme": "no-local-version"},
+            ),
+            ('{local_scheme = "a\\u0062"}', {"local_scheme": "ab"}),
+            ('{unknown = "dropped"}', {}),
+        ],
+    )
+    def test_read_toml_simple_inline_map(
+        self, value: str, expected: dict[str, str]
+    ) -> None:
+        """Simple inline maps parse like full TOML, including schema validation."""
+        from vcs_versioning._overrides import ConfigOverridesDict
+        from vcs_versioning.overrides import EnvReader
+
+        reader = EnvReader(tools_names=("TOOL_A",), env={"TOOL_A_OVERRIDES": value})
+
+        assert reader.read_toml("OVERRIDES", schema=ConfigOverridesDict) == expected
+
     def test_read_toml_full_document(self) -> None:
         """Test reading a full TOML document."""
         from vcs_versioning._overrides import PretendMetadataDict
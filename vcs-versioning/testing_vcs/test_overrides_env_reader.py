@@ -5,6 +5,7 @@ import logging
 import pytest
 from vcs_versioning._overrides import (
     _find_close_env_var_matches,
+    _group_env_vars_by_prefix,
     _search_env_vars_with_prefix,
 )
 from vcs_versioning.overrides import EnvReader
@@ -126,6 +127,26 @@ class TestFindCloseEnvVarMatches:
         assert len(close_matches) == 0
 
 
+def test_group_env_vars_by_prefix() -> None:
+    """Test that variables are grouped under every prefix they start with."""
+    env = {
+        "SETUPTOOLS_SCM_TEST_FOR_MY_PACKAGE": "1",
+        "VCS_VERSIONING_TEST_FOR_MY_PACKAGE": "2",
+        "VCS_VERSIONING_OTHER_FOR_MY_PACKAGE": "3",
+        "PATH": "/usr/bin",
+    }
+
+    grouped = _group_env_vars_by_prefix(
+        ["SETUPTOOLS_SCM_TEST_FOR_", "VCS_VERSIONING_TEST_FOR_", "HATCH_TEST_FOR_"],
+        env,
+    )
+
+    assert grouped == {
+        "SETUPTOOLS_SCM_TEST_FOR_": {"SETUPTOOLS_SCM_TEST_FOR_MY_PACKAGE": "1"},
+        "VCS_VERSIONING_TEST_FOR_": {"VCS_VERSIONING_TEST_FOR_MY_PACKAGE": "2"},
+    }
+
+
 class TestReadNamedEnvEnhanced:
     """Test the enhanced read_named_env function."""
 
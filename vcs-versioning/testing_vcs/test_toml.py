@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from vcs_versioning._toml import InvalidTomlError, read_toml_content
+
+PYPROJECT = """\
+[build-system]
+requires = ["setuptools", "vcs-versioning"]
+
+[project]
+name = "demo"
+dynamic = ["version"]
+
+[tool.vcs-versioning]
+version_scheme = "guess-next-dev"
+"""
+
+
+def test_read_toml_content_results_do_not_share_tables(tmp_path: Path) -> None:
+    """Parsed documents are memoized, callers must not see each other's edits"""
+    path = tmp_path / "pyproject.toml"
+    path.write_text(PYPROJECT, encoding="utf-8")
+
+    first = read_toml_content(path)
+    first["project"]["name"] = "changed"
+    first["project"]["dynamic"].append("readme")
+    first["build-system"]["requires"].clear()
+    first["tool"]["vcs-versioning"]["version_scheme"] = "release-branch-semver"
+    del first["tool"]
+
+    second = read_toml_content(path)
+    assert second == {
+        "build-system": {"requires": ["setuptools", "vcs-versioning"]},
+        "project": {"name": "demo", "dynamic": ["version"]},
+        "tool": {"vcs-versioning": {"version_scheme": "guess-next-dev"}},
+    }
+
+
+def test_read_toml_content_invalid_utf8(tmp_path: Path) -> None:
+    """Undecodable files are reported as invalid TOML"""
+    path = tmp_path / "pyproject.toml"
+    path.write_bytes(b'[project]\nname = "d\xe9mo"\n')
+
+    with pytest.raises(InvalidTomlError, match="Invalid TOML in") as excinfo:
+        read_toml_content(path)
+    assert isinstance(excinfo.value.__cause__, UnicodeDecodeError)
@@ -10,6 +10,8 @@ from vcs_versioning import Configuration, NonNormalizedVersion
 from vcs_versioning._scm_version import ScmVersion, meta
 from vcs_versioning._version_schemes import (
     calver_by_date,
+    combine_version_with_local_parts,
+    date_ver_match,
     format_version,
     guess_next_date_ver,
     guess_next_version,
@@ -18,6 +20,7 @@ from vcs_versioning._version_schemes import (
     release_branch_semver_version,
     simplified_semver_version,
 )
+from vcs_versioning._version_schemes._standard import _date_ver_parts
 
 c = Configuration()
 c_non_normalize = Configuration(version_cls=NonNormalizedVersion)
@@ -118,6 +121,16 @@ def test_next_semver(version: ScmVersion, expected_next: str) -> None:
             "1.1.0.dev2",
             id="false_positive_release_branch",
         ),
+        pytest.param(
+            meta("1.2.0", distance=3, branch="release/01.2", config=c),
+            "1.3.0.dev3",
+            id="release_branch_zero_padded_is_not_matched",
+        ),
+        pytest.param(
+            meta("1!1.2.0", distance=3, branch="release/1.2", config=c),
+            "1.3.0.dev3",
+            id="release_branch_epoch_tag_is_not_matched",
+        ),
         pytest.param(
             meta("2.0.dev0", distance=5, branch="master", config=c),
             "2.0.0.dev5",
@@ -286,6 +299,39 @@ def test_format_version_schemes() -> None:
     assert format_version(version) == "1.0"
 
 
+@pytest.mark.parametrize(
+    ("main_version", "local_parts", "expected"),
+    [
+        ("1.2.0", ("build.123", "d20090213"), "1.2.0+build.123.d20090213"),
+        ("1.2.0", ("build.123", None), "1.2.0+build.123"),
+        ("1.2.0+build.123", ("d20090213",), "1.2.0+build.123.d20090213"),
+        ("1.2.0+build.123", ("build.123",), "1.2.0+build.123"),
+        ("1.2.0", (None, None), "1.2.0"),
+        ("1.2.0", ("", "+", " "), "1.2.0"),
+        ("1.2.0", ("+g1.d2",), "1.2.0+g1.d2"),
+        ("1.2.0", ("a.a..b",), "1.2.0+a.b"),
+    ],
+)
+def test_combine_version_with_local_parts(
+    main_version: str, local_parts: tuple[str | None, ...], expected: str
+) -> None:
+    assert combine_version_with_local_parts(main_version, *local_parts) == expected
+
+
+@pytest.mark.parametrize(
+    "ver",
+    ["24.1.2", "v2024.01.02.3", "24.1.2.", "24.1.2.a", "241.1.2", "24.123.2", "1.2"],
+)
+def test_date_ver_parts_matches_regex(ver: str) -> None:
+    match = date_ver_match(ver)
+    expected = (
+        None
+        if match is None
+        else {key: match.group(key) for key in ("prefix", "year", "date", "patch")}
+    )
+    assert _date_ver_parts(ver) == expected
+
+
 def test_custom_version_schemes() -> None:
     version = meta(
         "1.0",
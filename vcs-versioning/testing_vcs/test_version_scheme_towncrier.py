@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -132,6 +133,26 @@ def test_find_fragments_mixed_types(changelog_dir: Path) -> None:
     assert len(fragments["doc"]) == 1
 
 
+def test_find_fragments_cached_by_directory_mtime(changelog_dir: Path) -> None:
+    """Settled directories are cached until their mtime changes."""
+    (changelog_dir / "1.feature.md").write_text("Feature")
+    os.utime(changelog_dir, ns=(0, 10**9))
+
+    fragments = _find_fragments(changelog_dir.parent)
+    assert fragments["feature"] == ["1.feature.md"]
+    fragments["feature"].append("mutated")
+
+    # the mtime did not change, so the listing is served from the cache
+    (changelog_dir / "2.bugfix.md").write_text("Bugfix")
+    os.utime(changelog_dir, ns=(0, 10**9))
+    fragments = _find_fragments(changelog_dir.parent)
+    assert fragments["feature"] == ["1.feature.md"]
+    assert fragments["bugfix"] == []
+
+    os.utime(changelog_dir, ns=(0, 2 * 10**9))
+    assert _find_fragments(changelog_dir.parent)["bugfix"] == ["2.bugfix.md"]
+
+
 def _empty_fragments() -> dict[str, list[str]]:
     return {
         "major": [],
@@ -577,3 +598,30 @@ def test_version_from_fragments_custom_directory(tmp_path: Path) -> None:
     )
     result = version_from_fragments(version)
     assert result.startswith("1.1.0.dev3")
+
+
+def test_version_from_fragments_relative_config_follows_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A relative config path is resolved against the current directory each call."""
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    project = tmp_path / "project"
+    (project / "changelog.d").mkdir(parents=True)
+    (project / "changelog.d" / "1.feature.md").write_text("Add feature")
+    (project / "pyproject.toml").write_text("[project]\nname = 'demo'\n")
+
+    config = _config.Configuration(relative_to="pyproject.toml")
+    version = ScmVersion(
+        tag=Version("1.2.3"),
+        distance=5,
+        node="abc123",
+        dirty=False,
+        config=config,
+    )
+
+    monkeypatch.chdir(empty)
+    assert version_from_fragments(version).startswith("1.2.4.dev5")
+
+    monkeypatch.chdir(project)
+    assert version_from_fragments(version).startswith("1.3.0.dev5")